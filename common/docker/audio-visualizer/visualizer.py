@@ -19,6 +19,7 @@ import sys
 
 import numpy as np
 import websockets
+import websockets.exceptions
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -79,12 +80,16 @@ _DECAY_FACTOR = np.float32(1.0) - DECAY_COEFF
 
 clients: set = set()
 prev_db: np.ndarray = np.full(NUM_BANDS, NOISE_FLOOR, dtype=np.float32)
-audio_ring: np.ndarray = np.zeros(FFT_SIZE, dtype=np.float32)
-_ring_pos: int = 0  # circular write position — avoids np.roll copy
+# Mirrored ring: every sample is stored at i and i + FFT_SIZE, so the
+# ordered FFT window is always the contiguous view [_ring_pos:_ring_pos + FFT_SIZE]
+audio_ring: np.ndarray = np.zeros(2 * FFT_SIZE, dtype=np.float32)
+_ring_pos: int = 0  # circular write position in [0, FFT_SIZE)
 
 # Pre-allocated buffers to avoid per-frame allocation
 _cumsum_buf: np.ndarray = np.zeros(FFT_SIZE // 2 + 2, dtype=np.float32)
-_ordered_buf: np.ndarray = np.zeros(FFT_SIZE, dtype=np.float32)
+_win_buf: np.ndarray = np.zeros(FFT_SIZE, dtype=np.float32)
+_fft_buf: np.ndarray = np.zeros(FFT_SIZE // 2 + 1, dtype=np.complex64)
+_power_buf: np.ndarray = np.zeros(FFT_SIZE // 2 + 1, dtype=np.float32)
 _dc_estimate: float = 0.0  # rolling DC offset estimate
 
 
@@ -114,10 +119,33 @@ BAND_BINS = compute_band_bins()
 WINDOW = np.hanning(FFT_SIZE).astype(np.float32)
 # Window correction factor for power (Hanning window)
 WINDOW_POWER_CORR = 1.0 / np.mean(WINDOW ** 2)
+# 10*log10(x) == _DB_PER_LOG2 * log2(x); log2 is the cheaper libm call.
+# Window power correction and 1/N² scaling become a constant dB offset.
+_DB_PER_LOG2 = np.float32(10.0 / np.log2(10.0))
+_POWER_DB_OFFSET = np.float32(10.0 * np.log10(WINDOW_POWER_CORR / (FFT_SIZE * FFT_SIZE)))
+# Window with the int16 -> [-1.0, 1.0] normalization (0 dBFS = 32768) folded in
+_WINDOW_SCALED = (WINDOW / np.float32(32768.0)).astype(np.float32)
 
-# Pre-compute reduceat indices for vectorized band power summation
-_BAND_EDGES = np.array([lo for lo, _ in BAND_BINS], dtype=np.intp)
-_BAND_HI = np.array([hi for _, hi in BAND_BINS], dtype=np.intp)
+# Pre-compute band index arrays for vectorized band power summation,
+# clipped to the rfft length once here instead of on every frame
+_SPEC_LEN = FFT_SIZE // 2 + 1
+_BAND_EDGES = np.minimum([lo for lo, _ in BAND_BINS], _SPEC_LEN).astype(np.intp)
+_BAND_HI = np.minimum([hi for _, hi in BAND_BINS], _SPEC_LEN).astype(np.intp)
+
+
+# Threshold ~-70 dBFS — practical noise floor to skip FFT on near-silence.
+# Compared as energy (sum of squares) so no sqrt or temporary is needed.
+SILENCE_RMS = 30.0
+_SILENCE_ENERGY_PER_SAMPLE = SILENCE_RMS * SILENCE_RMS
+
+
+def _reset_analysis() -> None:
+    """Clear the ring buffer, DC estimate and smoothed levels."""
+    global _ring_pos, _dc_estimate
+    audio_ring[:] = 0.0
+    _ring_pos = 0
+    _dc_estimate = 0.0
+    prev_db[:] = NOISE_FLOOR
 
 
 def analyze_pcm(new_samples: np.ndarray) -> str | None:
@@ -128,71 +156,58 @@ def analyze_pcm(new_samples: np.ndarray) -> str | None:
     """
     global prev_db, audio_ring, _ring_pos, _dc_estimate
 
-    # Check for silence on NEW samples (not ring buffer — which has old data)
-    # Threshold ~-70 dBFS — practical noise floor to skip FFT on near-silence
-    rms_new = np.sqrt(np.mean(new_samples ** 2))
-    if rms_new < 30.0:
-        audio_ring[:] = 0.0
-        _ring_pos = 0
-        _dc_estimate = 0.0
-        prev_db[:] = NOISE_FLOOR
-        return _format_db(prev_db)
-
-    # Circular ring buffer — write new samples without copying the whole array
+    # Check for silence on NEW samples (not ring buffer — which has old data);
+    # silent hops skip the window, FFT and dB stages entirely
     n = len(new_samples)
+    if np.dot(new_samples, new_samples) < _SILENCE_ENERGY_PER_SAMPLE * n:
+        _reset_analysis()
+        return _SILENCE_OUT
+
+    # Mirrored ring buffer — write new samples into both halves
     if n >= FFT_SIZE:
-        audio_ring[:] = new_samples[-FFT_SIZE:]
+        audio_ring[:FFT_SIZE] = new_samples[-FFT_SIZE:]
+        audio_ring[FFT_SIZE:] = audio_ring[:FFT_SIZE]
         _ring_pos = 0
     else:
         end = _ring_pos + n
         if end <= FFT_SIZE:
             audio_ring[_ring_pos:end] = new_samples
+            audio_ring[_ring_pos + FFT_SIZE:end + FFT_SIZE] = new_samples
         else:
             split = FFT_SIZE - _ring_pos
-            audio_ring[_ring_pos:] = new_samples[:split]
+            audio_ring[_ring_pos:end] = new_samples
+            audio_ring[_ring_pos + FFT_SIZE:] = new_samples[:split]
             audio_ring[:n - split] = new_samples[split:]
         _ring_pos = end % FFT_SIZE
 
-    # Get ordered view from circular buffer into pre-allocated buffer
-    if _ring_pos == 0:
-        ordered = audio_ring
-    else:
-        _ordered_buf[:FFT_SIZE - _ring_pos] = audio_ring[_ring_pos:]
-        _ordered_buf[FFT_SIZE - _ring_pos:] = audio_ring[:_ring_pos]
-        ordered = _ordered_buf
-
-    # Normalize to [-1.0, 1.0] (0 dBFS = 32768)
-    normalized = ordered / 32768.0
+    # Oldest-to-newest window as a zero-copy view of the mirrored ring
+    ordered = audio_ring[_ring_pos:_ring_pos + FFT_SIZE]
 
-    # Rolling DC offset — avoids full-array np.mean() every frame
-    _dc_estimate = _dc_estimate * 0.95 + np.mean(new_samples / 32768.0) * 0.05
-    normalized = normalized - _dc_estimate
+    # Rolling DC offset from the new hop only — avoids a full-window mean
+    _dc_estimate = _dc_estimate * 0.95 + float(np.mean(new_samples)) * (0.05 / 32768.0)
 
-    # Apply window
-    windowed = normalized * WINDOW
+    # Remove DC, normalize and window in float32 scratch — a float64 DC
+    # scalar would otherwise promote the whole FFT input to float64
+    np.subtract(ordered, np.float32(_dc_estimate * 32768.0), out=_win_buf)
+    np.multiply(_win_buf, _WINDOW_SCALED, out=_win_buf)
 
-    # FFT — power spectrum (V²)
-    spectrum = np.abs(np.fft.rfft(windowed)) ** 2
-
-    # Apply window power correction and dBFS scaling in one step
-    spectrum *= (WINDOW_POWER_CORR / (FFT_SIZE * FFT_SIZE))
+    # FFT — power spectrum (V²), computed into pre-allocated buffers
+    np.fft.rfft(_win_buf, out=_fft_buf)
+    spectrum = np.abs(_fft_buf, out=_power_buf)
+    spectrum *= spectrum
 
     # Band power summation using pre-allocated cumsum buffer
-    spec_len = len(spectrum)
-    edges = np.minimum(_BAND_EDGES, spec_len)
-    hi = np.minimum(_BAND_HI, spec_len)
-
     _cumsum_buf[0] = 0.0
-    np.cumsum(spectrum, out=_cumsum_buf[1:spec_len + 1])
-    band_power = np.maximum(_cumsum_buf[hi] - _cumsum_buf[edges], 0.0)
+    np.cumsum(spectrum, out=_cumsum_buf[1:_SPEC_LEN + 1])
+    band_power = np.maximum(_cumsum_buf[_BAND_HI] - _cumsum_buf[_BAND_EDGES], 0.0)
 
-    # Convert to dBFS (no normalization — bars reflect actual volume)
+    # Convert to dBFS in place (no normalization — bars reflect actual volume);
+    # empty bands give -inf and are clamped to the noise floor
     with np.errstate(divide="ignore"):
-        band_db = np.where(
-            band_power > 0,
-            np.maximum(10.0 * np.log10(band_power), NOISE_FLOOR),
-            NOISE_FLOOR,
-        )
+        band_db = np.log2(band_power, out=band_power)
+    band_db *= _DB_PER_LOG2
+    band_db += _POWER_DB_OFFSET
+    np.maximum(band_db, NOISE_FLOOR, out=band_db)
 
     # In-place asymmetric smoothing — avoids intermediate array allocation
     diff = band_db - prev_db
@@ -201,12 +216,21 @@ def analyze_pcm(new_samples: np.ndarray) -> str | None:
     return _format_db(prev_db)
 
 
+# One %-format for the whole frame instead of a str() per band
+_DB_FORMAT = ";".join(["%.1f"] * NUM_BANDS)
+
+
 def _format_db(db_vals: np.ndarray) -> str:
     """Format dBFS values as semicolon-separated string."""
-    rounded = np.round(db_vals, 1)
-    return ";".join(str(v) for v in rounded)
+    return _DB_FORMAT % tuple(db_vals.tolist())
 
 
+_SILENCE_OUT = _format_db(np.full(NUM_BANDS, NOISE_FLOOR, dtype=np.float32))
+
+
+# Per-client send failures that just mean "drop this client"
+_SEND_ERRORS = (OSError, RuntimeError, websockets.exceptions.ConnectionClosed)
+
 # Dedup cache: skips sending identical consecutive frames (e.g. silence).
 # A late-joining client may miss one frame (~33ms) until data changes.
 _last_broadcast: str = ""
@@ -221,13 +245,18 @@ async def broadcast(data: str) -> None:
     if data == _last_broadcast:
         return
     _last_broadcast = data
+    # Send concurrently so one slow client doesn't delay the others
+    snapshot = list(clients)
+    results = await asyncio.gather(
+        *(client.send(data) for client in snapshot), return_exceptions=True
+    )
     dead = set()
-    for client in clients:
-        try:
-            await client.send(data)
-        except (OSError, RuntimeError, websockets.exceptions.ConnectionClosed) as e:
-            logger.debug(f"WebSocket send failed: {e}")
+    for client, result in zip(snapshot, results):
+        if isinstance(result, _SEND_ERRORS):
+            logger.debug(f"WebSocket send failed: {result}")
             dead.add(client)
+        elif isinstance(result, BaseException):
+            raise result
     clients.difference_update(dead)
 
 
@@ -353,12 +382,8 @@ async def read_loopback_and_broadcast() -> None:
 
                     if not data:
                         logger.warning("ALSA read failed, reopening...")
-                        prev_db[:] = NOISE_FLOOR
-                        _ring_pos = 0
-                        zero_msg = ";".join(
-                            str(NOISE_FLOOR) for _ in range(NUM_BANDS)
-                        )
-                        await broadcast(zero_msg)
+                        _reset_analysis()
+                        await broadcast(_SILENCE_OUT)
                         break
 
                     # Parse 16-bit stereo PCM, mix to mono
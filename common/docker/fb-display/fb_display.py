@@ -21,6 +21,7 @@ import socket
 import sys
 import threading
 import time
+from collections import OrderedDict
 from typing import Callable, Optional
 
 import numpy as np
@@ -68,14 +69,21 @@ server_info: dict = {}
 
 SNAPCAST_MDNS_TYPE = "_snapcast._tcp.local."
 DISCOVERY_TIMEOUT = 5.0
+DISCOVERY_SETTLE = 0.5  # extra wait after the first reply for other servers
 MAX_RECONNECT_BEFORE_DISCOVERY = 3
 
 
 async def discover_snapservers(timeout: float = DISCOVERY_TIMEOUT) -> list[str]:
-    """Discover snapcast servers via mDNS. Returns list of IPs."""
+    """Discover snapcast servers via mDNS. Returns list of IPs.
+
+    Returns DISCOVERY_SETTLE after the first reply rather than always
+    waiting the full timeout.
+    """
     from zeroconf import ServiceBrowser, Zeroconf
 
     servers: list[str] = []
+    loop = asyncio.get_running_loop()
+    found = asyncio.Event()
 
     class _Listener:
         def add_service(self, zc: Zeroconf, type_: str, name: str) -> None:
@@ -85,6 +93,7 @@ async def discover_snapservers(timeout: float = DISCOVERY_TIMEOUT) -> list[str]:
                 if ip not in servers:
                     servers.append(ip)
                     logger.info(f"mDNS: discovered snapcast server at {ip}")
+                    loop.call_soon_threadsafe(found.set)  # zeroconf thread
 
         def remove_service(self, zc: Zeroconf, type_: str, name: str) -> None:
             pass
@@ -95,7 +104,10 @@ async def discover_snapservers(timeout: float = DISCOVERY_TIMEOUT) -> list[str]:
     zc = Zeroconf()
     browser = ServiceBrowser(zc, SNAPCAST_MDNS_TYPE, _Listener())
     try:
-        await asyncio.sleep(timeout)
+        await asyncio.wait_for(found.wait(), timeout)
+        await asyncio.sleep(min(DISCOVERY_SETTLE, timeout))
+    except TimeoutError:
+        pass
     finally:
         browser.cancel()
         zc.close()
@@ -138,6 +150,7 @@ _band_lock = threading.Lock()
 def resize_bands(n: int) -> None:
     """Resize all band arrays and recompute layout when NUM_BANDS changes."""
     global NUM_BANDS, bands, display_bands, peak_bands, peak_time, layout
+    global _idle_offsets
     with _band_lock:
         if n == NUM_BANDS:
             return
@@ -146,6 +159,7 @@ def resize_bands(n: int) -> None:
         display_bands = np.full(n, NOISE_FLOOR, dtype=np.float64)
         peak_bands = np.zeros(n, dtype=np.float64)
         peak_time = np.zeros(n, dtype=np.float64)
+        _idle_offsets = np.arange(n) * IDLE_PHASE_STEP
         precompute_colors()
         precompute_fb_colors()
         layout = compute_layout()
@@ -167,6 +181,8 @@ DISPLAY_RANGE = 72.0  # maps DISPLAY_FLOOR..0 dBFS to 0..1
 # Idle animation state
 idle_animation_phase: float = 0.0
 IDLE_ANIMATION_SPEED = 0.05  # radians per frame
+IDLE_PHASE_STEP = 0.3  # radians between adjacent bars
+_idle_offsets = np.arange(NUM_BANDS) * IDLE_PHASE_STEP  # rebuilt by resize_bands
 
 
 def generate_idle_wave() -> np.ndarray:
@@ -176,10 +192,12 @@ def generate_idle_wave() -> np.ndarray:
     if idle_animation_phase > 2 * np.pi:
         idle_animation_phase -= 2 * np.pi
 
-    # Vectorized wave: phase offset per bar, scaled to low levels
-    offsets = idle_animation_phase + np.arange(NUM_BANDS) * 0.3
-    wave = np.sin(offsets) * 0.5 + 0.5
-    return DISPLAY_FLOOR + 4 + wave * 6
+    # Vectorized wave: precomputed phase offset per bar, scaled in place to
+    # DISPLAY_FLOOR + 4..10 (sin * 3 + 7)
+    wave = np.sin(_idle_offsets + idle_animation_phase)
+    wave *= 3.0
+    wave += DISPLAY_FLOOR + 7
+    return wave
 
 
 # Metadata state
@@ -187,6 +205,10 @@ current_metadata: dict | None = None
 metadata_version: int = 0  # bumped on change
 cached_artwork: Image.Image | None = None
 cached_artwork_url: str = ""
+# Art panel image already resized for (source, size): volume and server-info
+# redraws reuse it instead of re-running the LANCZOS resize
+_resized_art: Image.Image | None = None
+_resized_art_key: tuple[str, int] = ("", 0)
 
 # Playback time tracking (local clock for smooth updates)
 _playback_start: float = 0.0  # monotonic time when playback started
@@ -236,8 +258,9 @@ _progress_cache: dict = {
 _logo_img: Image.Image | None = None
 _brand_img: Image.Image | None = None
 
-# Cached fonts (loaded once)
-_font_cache: dict[tuple[str, int], ImageFont.FreeTypeFont] = {}
+# Cached fonts (loaded once), least recently used evicted first: fit_font
+# probes many sizes, which must not push out the sizes drawn every frame
+_font_cache: OrderedDict[tuple[str, int], ImageFont.FreeTypeFont] = OrderedDict()
 _FONT_CACHE_MAX = 200
 
 # Layout geometry (computed once in compute_layout)
@@ -309,6 +332,18 @@ def open_framebuffer() -> None:
     fb_fd = fd
 
 
+def _fb_rows(y: int, h: int) -> np.ndarray:
+    """Writable (h, fb_stride) byte view of framebuffer rows y..y+h-1."""
+    return np.frombuffer(
+        fb_mmap, dtype=np.uint8, count=h * fb_stride, offset=y * fb_stride
+    ).reshape(h, fb_stride)
+
+
+def _pixel_row_bytes(pixels: np.ndarray) -> np.ndarray:
+    """View native-format pixels (h,w) uint16 or (h,w,4) uint8 as (h, row bytes)."""
+    return np.ascontiguousarray(pixels).view(np.uint8).reshape(pixels.shape[0], -1)
+
+
 def write_region_to_fb_fast(fb_pixels: np.ndarray, x: int, y: int) -> None:
     """Write a native-format pixel array to the framebuffer at position (x, y).
 
@@ -334,10 +369,10 @@ def write_region_to_fb_fast(fb_pixels: np.ndarray, x: int, y: int) -> None:
     bpp_bytes = fb_bpp // 8
 
     try:
-        for row in range(h):
-            offset = (y + row) * fb_stride + x * bpp_bytes
-            fb_mmap.seek(offset)
-            fb_mmap.write(fb_pixels[row].tobytes())
+        # One strided copy into the mapping instead of a seek+write per row
+        _fb_rows(y, h)[:, x * bpp_bytes : (x + w) * bpp_bytes] = _pixel_row_bytes(
+            fb_pixels
+        )
     except (ValueError, OSError) as e:
         logger.error(f"Framebuffer write failed: {e}")
 
@@ -370,13 +405,8 @@ def write_full_frame(img: Image.Image) -> None:
 
             chunk_rgb = np.array(strip.convert("RGB"))
             chunk_fb = _rgb_to_fb_native(chunk_rgb)
-            if fb_stride == row_bytes:
-                fb_mmap.seek(fb_y0 * fb_stride)
-                fb_mmap.write(chunk_fb.tobytes())
-            else:
-                for row in range(chunk_fb.shape[0]):
-                    fb_mmap.seek((fb_y0 + row) * fb_stride)
-                    fb_mmap.write(chunk_fb[row].tobytes())
+            rows = _fb_rows(fb_y0, fb_y1 - fb_y0)
+            rows[:, :row_bytes] = _pixel_row_bytes(chunk_fb)
     except (ValueError, OSError) as e:
         logger.error(f"Framebuffer full-frame write failed: {e}")
 
@@ -385,10 +415,11 @@ def _get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
     """Load font with caching."""
     key = ("bold" if bold else "regular", size)
     if key in _font_cache:
+        _font_cache.move_to_end(key)
         return _font_cache[key]
 
     if len(_font_cache) >= _FONT_CACHE_MAX:
-        _font_cache.pop(next(iter(_font_cache)))
+        _font_cache.popitem(last=False)
 
     if bold:
         paths = [
@@ -416,6 +447,13 @@ def lerp_color(c1: tuple, c2: tuple, t: float) -> tuple:
     return tuple(int(a + (b - a) * t) for a, b in zip(c1, c2))
 
 
+def lerp_color_array(c1: tuple, c2: tuple, t: np.ndarray) -> np.ndarray:
+    """Vectorized lerp_color: (N,) interpolation factors -> (N, 3) uint8 colors."""
+    a = np.asarray(c1, dtype=np.float64)
+    b = np.asarray(c2, dtype=np.float64)
+    return (a + (b - a) * t[:, None]).astype(np.uint8)
+
+
 def rainbow_color(i: int, total: int) -> tuple[int, int, int]:
     """Get rainbow color for bar index (hue 0-300 degrees)."""
     hue = (i / total) * (300 / 360)  # 0 to 300 degrees
@@ -459,13 +497,10 @@ def precompute_colors() -> None:
 
 def create_background() -> Image.Image:
     """Create gradient background image."""
-    img = Image.new("RGB", (WIDTH, HEIGHT))
-    draw = ImageDraw.Draw(img)
-    for y in range(HEIGHT):
-        t = y / HEIGHT
-        color = lerp_color(BG_TOP, BG_BOTTOM, t)
-        draw.line([(0, y), (WIDTH, y)], fill=color)
-    return img
+    # One-pixel-wide gradient column, stretched horizontally by PIL
+    rows = lerp_color_array(BG_TOP, BG_BOTTOM, np.arange(HEIGHT) / HEIGHT)
+    column = Image.fromarray(rows[:, None, :])
+    return column.resize((WIDTH, HEIGHT), Image.NEAREST)
 
 
 def compute_layout() -> dict:
@@ -562,11 +597,18 @@ def _rgb_to_fb_native(rgb_array: np.ndarray) -> np.ndarray:
     Returns uint16 (h,w) for 16bpp or uint8 (h,w,4) for 32bpp.
     """
     if fb_bpp == 16:
-        return (
-            (rgb_array[:, :, 0].astype(np.uint16) & 0xF8) << 8
-            | (rgb_array[:, :, 1].astype(np.uint16) & 0xFC) << 3
-            | rgb_array[:, :, 2].astype(np.uint16) >> 3
-        )
+        # RGB565 built in place with out= ufuncs: one scratch array instead
+        # of three astype copies plus a temporary per operator
+        out = np.empty(rgb_array.shape[:2], dtype=np.uint16)
+        tmp = np.empty_like(out)
+        np.bitwise_and(rgb_array[:, :, 0], 0xF8, out=out, casting="unsafe")
+        out <<= 8
+        np.bitwise_and(rgb_array[:, :, 1], 0xFC, out=tmp, casting="unsafe")
+        tmp <<= 3
+        out |= tmp
+        np.right_shift(rgb_array[:, :, 2], 3, out=tmp, casting="unsafe")
+        out |= tmp
+        return out
     else:
         h, w = rgb_array.shape[:2]
         out = np.empty((h, w, 4), dtype=np.uint8)
@@ -586,12 +628,14 @@ def _rgb_to_fb_native(rgb_array: np.ndarray) -> np.ndarray:
 
 
 _scale_idx_cache: dict[tuple, tuple] = {}
+_SCALE_IDX_CACHE_MAX = 32  # one entry per region size; bounded across resizes
 
 
 def _scale_to_fb(pixels: np.ndarray) -> np.ndarray:
     """Scale native-format pixel array from render to FB resolution.
 
-    Uses nearest-neighbor interpolation via numpy fancy indexing.
+    Uses nearest-neighbor interpolation: block broadcast for integer ratios,
+    numpy fancy indexing otherwise.
     Works for both 2D (uint16, 16bpp) and 3D (uint8 h×w×4, 32bpp) arrays.
     Caches index arrays for repeated same-size calls.
     """
@@ -602,8 +646,18 @@ def _scale_to_fb(pixels: np.ndarray) -> np.ndarray:
     new_h = round(h * FB_HEIGHT / HEIGHT)
     if new_w == w and new_h == h:
         return pixels
+    if new_h % h == 0 and new_w % w == 0:
+        # Integer ratio (e.g. 960x540 -> 1920x1080): broadcast each pixel to an
+        # sy x sx block; the reshape does one contiguous copy, ~2x faster than
+        # fancy indexing
+        sy, sx = new_h // h, new_w // w
+        tail = pixels.shape[2:]
+        blocks = np.broadcast_to(pixels[:, None, :, None], (h, sy, w, sx) + tail)
+        return blocks.reshape((new_h, new_w) + tail)
     key = (h, w, new_h, new_w)
     if key not in _scale_idx_cache:
+        if len(_scale_idx_cache) >= _SCALE_IDX_CACHE_MAX:
+            _scale_idx_cache.pop(next(iter(_scale_idx_cache)))
         row_idx = (np.arange(new_h) * h / new_h).astype(int)
         col_idx = (np.arange(new_w) * w / new_w).astype(int)
         _scale_idx_cache[key] = (row_idx, col_idx)
@@ -618,16 +672,29 @@ def _rgb_tuple_to_fb(r: int, g: int, b: int) -> int | tuple:
     return (255, r, g, b) if fb_big_endian else (b, g, r, 255)
 
 
+def _fb_pixel_values(colors: list[tuple[int, int, int]]) -> np.ndarray:
+    """Convert RGB tuples to one native FB pixel scalar per color.
+
+    uint16 RGB565 for 16bpp; for 32bpp the 4 pixel bytes are packed into a
+    uint32 so a fill is a scalar store into a uint32 view of the buffer.
+    """
+    rgb = np.asarray(colors, dtype=np.uint8).reshape(1, -1, 3)
+    native = _rgb_to_fb_native(rgb)[0]
+    if fb_bpp == 16:
+        return native
+    return native.view(np.uint32)[:, 0]
+
+
 # Pre-computed bar/peak colors in native FB format (populated after FB init)
-BAR_COLORS_FB: list = []
-PEAK_COLORS_FB: list = []
+BAR_COLORS_FB: np.ndarray = np.empty(0, dtype=np.uint32)
+PEAK_COLORS_FB: np.ndarray = np.empty(0, dtype=np.uint32)
 
 
 def precompute_fb_colors() -> None:
     """Pre-compute bar/peak colors in native FB pixel format."""
     global BAR_COLORS_FB, PEAK_COLORS_FB
-    BAR_COLORS_FB = [_rgb_tuple_to_fb(*c) for c in BAR_COLORS]
-    PEAK_COLORS_FB = [_rgb_tuple_to_fb(*c) for c in PEAK_COLORS]
+    BAR_COLORS_FB = _fb_pixel_values(BAR_COLORS)
+    PEAK_COLORS_FB = _fb_pixel_values(PEAK_COLORS)
 
 
 def _init_spectrum_buffer() -> None:
@@ -652,6 +719,9 @@ def fit_font(
     return _get_font(10, bold)
 
 
+_LOSSLESS_CODECS = frozenset({"FLAC", "WAV", "AIFF", "APE", "WV", "PCM", "DSD"})
+
+
 def _format_audio_badge(meta: dict) -> str:
     """Build audio format badge text from metadata."""
     codec = meta.get("codec", "")
@@ -663,7 +733,7 @@ def _format_audio_badge(meta: dict) -> str:
     bitrate = meta.get("bitrate", 0)
 
     # Lossless codecs: show sample rate and bit depth
-    lossless = codec in ("FLAC", "WAV", "AIFF", "APE", "WV", "PCM", "DSD")
+    lossless = codec in _LOSSLESS_CODECS
 
     parts = [codec]
     if lossless and sample_rate:
@@ -700,7 +770,7 @@ def _format_badge_color(meta: dict) -> tuple[int, int, int]:
     """Pick badge color based on codec quality tier."""
     codec = meta.get("codec", "")
     sample_rate = meta.get("sample_rate", 0)
-    lossless = codec in ("FLAC", "WAV", "AIFF", "APE", "WV", "PCM", "DSD")
+    lossless = codec in _LOSSLESS_CODECS
 
     if lossless and sample_rate > 48000:
         return _BADGE_COLOR_HD  # hi-res
@@ -709,48 +779,126 @@ def _format_badge_color(meta: dict) -> tuple[int, int, int]:
     return _BADGE_COLOR_LOSSY
 
 
+# Release date keys in display precedence (first/original release first)
+_RELEASE_DATE_KEYS = (
+    "original_date",
+    "original_release_date",
+    "first_release_date",
+    "release_group_first_date",
+    "date",
+)
+
+
 def _display_release_year(meta: dict) -> str:
     """Return the preferred release year for display.
 
     Prefer the first/original release date when the metadata service provides it;
     otherwise fall back to the edition-specific `date` field.
     """
-    for key in (
-        "original_date",
-        "original_release_date",
-        "first_release_date",
-        "release_group_first_date",
-        "date",
-    ):
+    for key in _RELEASE_DATE_KEYS:
         value = str(meta.get(key, "") or "").strip()
         if len(value) >= 4 and value[:4].isdigit():
             return value[:4]
     return ""
 
 
+# Shared HTTP session: keeps the connection to the metadata server alive
+# between artwork fetches instead of a new TCP handshake per track
+_http_session = requests.Session()
+
+# Artwork larger than this is dropped while streaming instead of buffered whole
+_ARTWORK_MAX_BYTES = 8 * 1024 * 1024
+
+# Negative cache: full artwork URL -> (monotonic retry time, consecutive
+# failures). Keyed by the resolved URL so a server failover retries at once.
+# Base frame redraws (volume, server info) would otherwise re-request a failing
+# URL and block on the HTTP timeout every time. Transient errors back off
+# exponentially; a 404 or oversized image waits the fixed not-found TTL.
+_failed_artwork: dict[str, tuple[float, int]] = {}
+_FAILED_ARTWORK_BACKOFF = 5.0  # seconds, first retry after a transient error
+_FAILED_ARTWORK_MAX_BACKOFF = 300.0
+_FAILED_ARTWORK_NOT_FOUND_TTL = 60.0
+_FAILED_ARTWORK_MAX = 64
+
+
+def _mark_artwork_failed(url: str, not_found: bool = False) -> None:
+    """Suppress fetches of url until its retry time has passed."""
+    entry = _failed_artwork.pop(url, None)
+    failures = entry[1] + 1 if entry else 1
+    if len(_failed_artwork) >= _FAILED_ARTWORK_MAX:
+        _failed_artwork.pop(next(iter(_failed_artwork)))
+    if not_found:
+        delay = _FAILED_ARTWORK_NOT_FOUND_TTL
+    else:
+        delay = min(
+            _FAILED_ARTWORK_MAX_BACKOFF, _FAILED_ARTWORK_BACKOFF * 2 ** (failures - 1)
+        )
+    _failed_artwork[url] = (time.monotonic() + delay, failures)
+
+
+def _read_capped(resp: requests.Response, limit: int) -> bytes | None:
+    """Read a streamed response body, or None if it exceeds limit bytes."""
+    buf = io.BytesIO()
+    for chunk in resp.iter_content(chunk_size=64 * 1024):
+        if buf.tell() + len(chunk) > limit:
+            return None
+        buf.write(chunk)
+    return buf.getvalue()
+
+
 def fetch_artwork(url: str) -> Image.Image | None:
     """Fetch and cache artwork image."""
     global cached_artwork, cached_artwork_url
     if url == cached_artwork_url and cached_artwork is not None:
         return cached_artwork
+    full_url = url
+    if url.startswith("/"):
+        full_url = f"http://{metadata_host}:{METADATA_HTTP_PORT}{url}"
+    failed = _failed_artwork.get(full_url)
+    if failed is not None and time.monotonic() < failed[0]:
+        return None
+    not_found = False
     try:
-        full_url = url
-        if url.startswith("/"):
-            full_url = f"http://{metadata_host}:{METADATA_HTTP_PORT}{url}"
-        resp = requests.get(full_url, timeout=3)
-        if resp.status_code == 200:
-            cached_artwork = Image.open(io.BytesIO(resp.content))
-            cached_artwork_url = url
-            return cached_artwork
-        elif resp.status_code != 404:
-            logger.debug(f"Artwork fetch returned {resp.status_code}: {url}")
+        with _http_session.get(full_url, timeout=3, stream=True) as resp:
+            if resp.status_code == 200:
+                data = _read_capped(resp, _ARTWORK_MAX_BYTES)
+                if data is not None:
+                    cached_artwork = Image.open(io.BytesIO(data))
+                    cached_artwork_url = url
+                    _failed_artwork.pop(full_url, None)
+                    return cached_artwork
+                logger.warning(f"Artwork exceeds {_ARTWORK_MAX_BYTES} bytes: {url}")
+                not_found = True
+            elif resp.status_code == 404:
+                not_found = True
+            else:
+                logger.debug(f"Artwork fetch returned {resp.status_code}: {url}")
     except requests.exceptions.RequestException as e:
         logger.debug(f"Artwork fetch failed: {e}")
     except Exception as e:
         logger.warning(f"Unexpected error fetching artwork: {e}")
+    _mark_artwork_failed(full_url, not_found)
     return None
 
 
+def _resize_art(src: str, img: Image.Image, size: int) -> Image.Image:
+    """Resize img to the art panel size, reusing the last result for src."""
+    global _resized_art, _resized_art_key
+    key = (src, size)
+    if _resized_art is None or key != _resized_art_key:
+        _resized_art = img.resize((size, size), Image.LANCZOS)
+        _resized_art_key = key
+    return _resized_art
+
+
+def _standby_art(path: str, size: int) -> Image.Image:
+    """Return the resized standby image, opening the file only on a cache miss."""
+    if _resized_art is not None and _resized_art_key == (path, size):
+        return _resized_art
+    with Image.open(path) as img:
+        return _resize_art(path, img, size)
+
+
 def render_base_frame() -> Image.Image:
     """Render static content: background, album art, track info.
 
@@ -783,17 +931,14 @@ def render_base_frame() -> Image.Image:
         if artwork_url:
             art_img = fetch_artwork(artwork_url)
             if art_img:
-                resized = art_img.resize((L["art_size"], L["art_size"]), Image.LANCZOS)
+                resized = _resize_art(artwork_url, art_img, L["art_size"])
                 bg.paste(resized, (L["art_x"], L["art_y"]))
     else:
         # Standby mode: show standby artwork
         standby_path = "/app/public/standby.png"
         if os.path.exists(standby_path):
             try:
-                standby_img = Image.open(standby_path)
-                resized = standby_img.resize(
-                    (L["art_size"], L["art_size"]), Image.LANCZOS
-                )
+                resized = _standby_art(standby_path, L["art_size"])
                 bg.paste(resized, (L["art_x"], L["art_y"]))
             except Exception as e:
                 logger.info(f"Failed to load standby image: {e}")
@@ -1273,6 +1418,10 @@ def _render_spectrum_locked() -> np.ndarray:
 
     marker_h = max(2, bar_w // 12)
 
+    # Whole-pixel view: at 32bpp each fill stores one uint32 per pixel instead
+    # of broadcasting a 4-byte tuple (~25x faster per bar)
+    px = buf if fb_bpp == 16 else buf.view(np.uint32)[:, :, 0]
+
     # Draw bars (this loop is necessary for array slice writes but body is minimal)
     for i in range(NUM_BANDS):
         fraction = fractions[i]
@@ -1284,18 +1433,12 @@ def _render_spectrum_locked() -> np.ndarray:
         if fraction >= 0.01:
             bar_h = max(2, int(fraction * bar_area_h))
             by = max(0, bar_base_y - bar_h)
-            if fb_bpp == 16:
-                buf[by:bar_base_y, bx : bx + bar_w] = BAR_COLORS_FB[i]
-            else:
-                buf[by:bar_base_y, bx : bx + bar_w, :] = BAR_COLORS_FB[i]
+            px[by:bar_base_y, bx : bx + bar_w] = BAR_COLORS_FB[i]
 
         if peak_bands[i] > 0.01:
             peak_h = int(peak_bands[i] * bar_area_h)
             peak_y = max(0, bar_base_y - peak_h)
-            if fb_bpp == 16:
-                buf[peak_y : peak_y + marker_h, bx : bx + bar_w] = PEAK_COLORS_FB[i]
-            else:
-                buf[peak_y : peak_y + marker_h, bx : bx + bar_w, :] = PEAK_COLORS_FB[i]
+            px[peak_y : peak_y + marker_h, bx : bx + bar_w] = PEAK_COLORS_FB[i]
 
     return buf
 
@@ -1366,9 +1509,59 @@ async def spectrum_ws_reader() -> None:
     )
 
 
+# Metadata fields drawn into the base frame. Volatile fields (bitrate, artwork,
+# artist_image, elapsed, duration) are left out to match metadata-service;
+# artwork is checked separately in _handle_metadata_message.
+_BASE_FRAME_FIELDS = (
+    "playing",
+    "title",
+    "artist",
+    "album",
+    "source",
+    "genre",
+    "track",
+    "disc",
+    *_RELEASE_DATE_KEYS,
+    "codec",
+    "sample_rate",
+    "bit_depth",
+)
+
+# Volume and mute are also drawn into the base frame, but slider drags send a
+# burst of updates, so their redraws are tracked separately and coalesced
+_VOLUME_FIELDS = ("volume", "muted")
+_VOLUME_REDRAW_DELAY = 0.25  # seconds
+
+
+def _metadata_fingerprint(meta: dict) -> tuple:
+    """Return the base-frame fields of meta as a tuple for change detection."""
+    return tuple(meta.get(key) for key in _BASE_FRAME_FIELDS)
+
+
+def _volume_fingerprint(meta: dict) -> tuple:
+    """Return the volume/mute fields of meta as a tuple for change detection."""
+    return tuple(meta.get(key) for key in _VOLUME_FIELDS)
+
+
+# Fingerprints of current_metadata (kept in sync by _handle_metadata_message)
+_current_fingerprint: tuple = ()
+_current_volume: tuple = ()
+# Monotonic deadline of a pending volume-only redraw (0 = none pending)
+_volume_redraw_at = 0.0
+
+
+def _flush_volume_redraw() -> None:
+    """Bump metadata_version once a pending volume-only redraw is due."""
+    global metadata_version, _volume_redraw_at
+    if _volume_redraw_at and time.monotonic() >= _volume_redraw_at:
+        _volume_redraw_at = 0.0
+        metadata_version += 1
+
+
 async def _handle_metadata_message(message: str) -> None:
     """Process metadata WebSocket message."""
-    global current_metadata, metadata_version
+    global current_metadata, metadata_version, _current_fingerprint, _volume_redraw_at
+    global _current_volume
     global _playback_start, _playback_offset, _is_playing, _last_duration
     global server_info
 
@@ -1403,23 +1596,30 @@ async def _handle_metadata_message(message: str) -> None:
             elif significant_seek:
                 logger.debug(f"Clock sync: seek to {new_elapsed}s")
 
-        # Ignore volatile fields for change detection (must match metadata-service)
-        _VOLATILE = {"bitrate", "artwork", "artist_image", "elapsed", "duration"}
-        old_stable = {
-            k: v for k, v in (current_metadata or {}).items() if k not in _VOLATILE
-        }
-        new_stable = {k: v for k, v in data.items() if k not in _VOLATILE}
-
         # Artwork changes need a base frame redraw even though they're volatile
         # on the server (artwork URL may arrive after title change)
         old_art = (current_metadata or {}).get("artwork", "")
         new_art = data.get("artwork", "")
         artwork_changed = old_art != new_art and new_art
 
-        if new_stable != old_stable or artwork_changed:
+        # Compare against the cached previous fingerprints
+        # (plain tuple equality rather than hash(), so no collision misses)
+        new_fingerprint = _metadata_fingerprint(data)
+        new_volume = _volume_fingerprint(data)
+        if artwork_changed or new_fingerprint != _current_fingerprint:
             current_metadata = data
+            _current_fingerprint = new_fingerprint
+            _current_volume = new_volume
+            _volume_redraw_at = 0.0  # this redraw picks up any pending volume
             metadata_version += 1
             logger.debug(f"Metadata updated: {data.get('title', 'N/A')}")
+        elif new_volume != _current_volume:
+            # Volume/mute only: redraw at most once per _VOLUME_REDRAW_DELAY,
+            # showing whatever value is current when render_loop flushes it
+            current_metadata = data
+            _current_volume = new_volume
+            if not _volume_redraw_at:
+                _volume_redraw_at = time.monotonic() + _VOLUME_REDRAW_DELAY
         else:
             current_metadata = data  # update volatile fields silently
     except json.JSONDecodeError as e:
@@ -1469,10 +1669,12 @@ async def metadata_ws_reader() -> None:
             await asyncio.sleep(5)
 
 
+SPECTRUM_ACTIVE_THRESHOLD = NOISE_FLOOR + 3.0  # dBFS
+
+
 def is_spectrum_active() -> bool:
     """Check if any spectrum band has meaningful signal above noise floor."""
-    threshold = NOISE_FLOOR + 3.0
-    return bool(np.any(bands > threshold))
+    return bool((bands > SPECTRUM_ACTIVE_THRESHOLD).any())
 
 
 _RENDER_MAX_ERRORS = 50
@@ -1518,6 +1720,7 @@ async def render_loop() -> None:
             start = time.monotonic()
 
             # Rebuild base frame if metadata changed
+            _flush_volume_redraw()
             if base_frame_version != metadata_version:
                 base_frame = await asyncio.get_event_loop().run_in_executor(
                     None, render_base_frame
@@ -1627,7 +1830,10 @@ async def main() -> None:
 def cleanup(signum: int | None = None, frame=None) -> None:
     """Clean up on exit."""
     if fb_mmap:
-        fb_mmap.close()
+        try:
+            fb_mmap.close()
+        except BufferError:
+            pass  # a render thread still holds a view; unmapped at exit
     if fb_fd:
         os.close(fb_fd)
     sys.exit(0)
@@ -1,12 +1,15 @@
 """Tests for fb-display renderer (pure logic, no hardware)."""
 
 import asyncio
+import io
 import sys
 import os
 import time
+from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
+from PIL import Image
 
 # Add fb-display to path
 sys.path.insert(
@@ -49,6 +52,29 @@ class TestFormatTime:
         assert fb_display.format_time(3600) == "1:00:00"
 
 
+class TestGetFont:
+    """Test font cache eviction."""
+
+    def setup_method(self):
+        fb_display._font_cache.clear()
+
+    def test_cached_instance_reused(self):
+        assert fb_display._get_font(20) is fb_display._get_font(20)
+        assert fb_display._get_font(20, bold=True) is not fb_display._get_font(20)
+
+    def test_recently_used_font_survives_eviction(self, monkeypatch):
+        monkeypatch.setattr(fb_display, "_FONT_CACHE_MAX", 3)
+        hot = fb_display._get_font(10)
+        fb_display._get_font(11)
+        fb_display._get_font(12)
+        fb_display._get_font(10)  # touch: now most recently used
+        fb_display._get_font(13)  # evicts 11, not 10
+        assert ("regular", 10) in fb_display._font_cache
+        assert ("regular", 11) not in fb_display._font_cache
+        assert fb_display._get_font(10) is hot
+        assert len(fb_display._font_cache) == 3
+
+
 class TestLerpColor:
     """Test color interpolation."""
 
@@ -63,6 +89,31 @@ class TestLerpColor:
         assert result == (100, 50, 25)
 
 
+class TestLerpColorArray:
+    """Test vectorized color interpolation and the gradient background."""
+
+    def test_matches_scalar_lerp(self):
+        t = np.linspace(0.0, 1.0, 37)
+        result = fb_display.lerp_color_array((10, 200, 0), (250, 20, 128), t)
+        assert result.shape == (37, 3)
+        assert result.dtype == np.uint8
+        for i, ti in enumerate(t):
+            expected = fb_display.lerp_color((10, 200, 0), (250, 20, 128), ti)
+            assert tuple(result[i]) == expected
+
+    def test_background_gradient(self, monkeypatch):
+        monkeypatch.setattr(fb_display, "WIDTH", 8)
+        monkeypatch.setattr(fb_display, "HEIGHT", 50)
+        img = fb_display.create_background()
+        assert img.size == (8, 50)
+        for y in (0, 17, 49):
+            expected = fb_display.lerp_color(
+                fb_display.BG_TOP, fb_display.BG_BOTTOM, y / 50
+            )
+            assert img.getpixel((0, y)) == expected
+            assert img.getpixel((7, y)) == expected
+
+
 class TestRainbowColor:
     """Test rainbow color generation."""
 
@@ -148,6 +199,11 @@ class TestIdleWave:
         w2 = fb_display.generate_idle_wave().copy()
         assert not np.array_equal(w1, w2)
 
+    def test_wave_range(self):
+        wave = fb_display.generate_idle_wave()
+        assert wave.min() >= fb_display.DISPLAY_FLOOR + 4 - 1e-9
+        assert wave.max() <= fb_display.DISPLAY_FLOOR + 10 + 1e-9
+
 
 class TestGetCurrentElapsed:
     """Test local clock elapsed time calculation."""
@@ -252,6 +308,150 @@ class TestDisplayReleaseYear:
         assert fb_display._display_release_year(meta) == ""
 
 
+class TestFetchArtwork:
+    """Test artwork download and caching."""
+
+    def setup_method(self):
+        fb_display.cached_artwork = None
+        fb_display.cached_artwork_url = ""
+        fb_display._failed_artwork.clear()
+
+    @staticmethod
+    def _png_response(status: int = 200):
+        buf = io.BytesIO()
+        Image.new("RGB", (4, 4), (255, 0, 0)).save(buf, format="PNG")
+        resp = MagicMock()
+        resp.status_code = status
+        data = buf.getvalue()
+        resp.iter_content.side_effect = lambda chunk_size: iter([data])
+        resp.__enter__.return_value = resp
+        return resp
+
+    def test_uses_shared_session(self, monkeypatch):
+        calls = []
+
+        def fake_get(url, **kwargs):
+            calls.append(url)
+            return self._png_response()
+
+        monkeypatch.setattr(fb_display._http_session, "get", fake_get)
+        monkeypatch.setattr(fb_display, "metadata_host", "10.0.0.5")
+        img = fb_display.fetch_artwork("/artwork/a.png")
+        assert img is not None
+        assert calls == [f"http://10.0.0.5:{fb_display.METADATA_HTTP_PORT}/artwork/a.png"]
+
+    def test_same_url_served_from_cache(self, monkeypatch):
+        calls = []
+
+        def fake_get(url, **kwargs):
+            calls.append(url)
+            return self._png_response()
+
+        monkeypatch.setattr(fb_display._http_session, "get", fake_get)
+        first = fb_display.fetch_artwork("http://example.com/a.png")
+        second = fb_display.fetch_artwork("http://example.com/a.png")
+        assert first is second
+        assert len(calls) == 1
+
+    def test_oversized_artwork_rejected(self, monkeypatch):
+        monkeypatch.setattr(fb_display._http_session, "get",
+                            lambda url, **kwargs: self._png_response())
+        monkeypatch.setattr(fb_display, "_ARTWORK_MAX_BYTES", 16)
+        url = "http://example.com/huge.png"
+        assert fb_display.fetch_artwork(url) is None
+        assert url in fb_display._failed_artwork
+
+    def test_failed_url_not_retried_within_ttl(self, monkeypatch):
+        calls = []
+
+        def fake_get(url, **kwargs):
+            calls.append(url)
+            return self._png_response(status=404)
+
+        monkeypatch.setattr(fb_display._http_session, "get", fake_get)
+        assert fb_display.fetch_artwork("http://example.com/missing.png") is None
+        assert fb_display.fetch_artwork("http://example.com/missing.png") is None
+        assert len(calls) == 1
+
+    def test_failed_url_retried_after_ttl(self, monkeypatch):
+        calls = []
+
+        def fake_get(url, **kwargs):
+            calls.append(url)
+            return self._png_response()
+
+        monkeypatch.setattr(fb_display._http_session, "get", fake_get)
+        url = "http://example.com/flaky.png"
+        fb_display._failed_artwork[url] = (time.monotonic() - 1.0, 3)  # expired
+        assert fb_display.fetch_artwork(url) is not None
+        assert len(calls) == 1
+        assert url not in fb_display._failed_artwork
+
+    def test_failed_relative_url_retried_on_new_server(self, monkeypatch):
+        calls = []
+
+        def fake_get(url, **kwargs):
+            calls.append(url)
+            return self._png_response(status=404 if "10.0.0.5" in url else 200)
+
+        monkeypatch.setattr(fb_display._http_session, "get", fake_get)
+        monkeypatch.setattr(fb_display, "metadata_host", "10.0.0.5")
+        assert fb_display.fetch_artwork("/artwork/a.png") is None
+        monkeypatch.setattr(fb_display, "metadata_host", "10.0.0.6")
+        assert fb_display.fetch_artwork("/artwork/a.png") is not None
+        assert len(calls) == 2
+
+    def test_resized_art_reused(self):
+        fb_display._resized_art = None
+        img = Image.new("RGB", (8, 8))
+        first = fb_display._resize_art("http://example.com/a.png", img, 4)
+        assert first.size == (4, 4)
+        assert fb_display._resize_art("http://example.com/a.png", img, 4) is first
+        assert fb_display._resize_art("http://example.com/a.png", img, 6) is not first
+        assert fb_display._resize_art("http://example.com/b.png", img, 6).size == (6, 6)
+
+    def test_standby_art_opened_only_on_miss(self, monkeypatch, tmp_path):
+        path = str(tmp_path / "standby.png")
+        Image.new("RGB", (8, 8), (0, 0, 255)).save(path)
+        fb_display._resized_art = None
+        opens = []
+        real_open = fb_display.Image.open
+
+        def counting_open(*args, **kwargs):
+            opens.append(args[0])
+            return real_open(*args, **kwargs)
+
+        monkeypatch.setattr(fb_display.Image, "open", counting_open)
+        first = fb_display._standby_art(path, 4)
+        assert first.size == (4, 4)
+        assert fb_display._standby_art(path, 4) is first
+        assert opens == [path]
+
+    def test_transient_failures_back_off(self, monkeypatch):
+        monkeypatch.setattr(fb_display.time, "monotonic", lambda: 1000.0)
+        url = "http://example.com/flaky.png"
+        delays = []
+        for _ in range(8):
+            fb_display._mark_artwork_failed(url)
+            delays.append(fb_display._failed_artwork[url][0] - 1000.0)
+        assert delays[:3] == [5.0, 10.0, 20.0]
+        assert delays[-1] == fb_display._FAILED_ARTWORK_MAX_BACKOFF
+
+    def test_not_found_uses_fixed_ttl(self, monkeypatch):
+        monkeypatch.setattr(fb_display.time, "monotonic", lambda: 1000.0)
+        url = "http://example.com/missing.png"
+        fb_display._mark_artwork_failed(url, not_found=True)
+        fb_display._mark_artwork_failed(url, not_found=True)
+        retry_at, failures = fb_display._failed_artwork[url]
+        assert retry_at == 1000.0 + fb_display._FAILED_ARTWORK_NOT_FOUND_TTL
+        assert failures == 2
+
+    def test_failed_cache_bounded(self):
+        for i in range(fb_display._FAILED_ARTWORK_MAX + 10):
+            fb_display._mark_artwork_failed(f"http://example.com/{i}.png")
+        assert len(fb_display._failed_artwork) == fb_display._FAILED_ARTWORK_MAX
+
+
 class TestRgbToFbNative:
     """Test RGB to framebuffer format conversion."""
 
@@ -293,6 +493,14 @@ class TestRgbToFbNative:
         assert result.shape == (10, 20)
         assert result.dtype == np.uint16
 
+    def test_16bpp_matches_scalar_conversion(self):
+        fb_display.fb_bpp = 16
+        rng = np.random.default_rng(0)
+        rgb = rng.integers(0, 256, size=(8, 8, 3), dtype=np.uint8)
+        result = fb_display._rgb_to_fb_native(rgb)
+        for y, x in ((0, 0), (3, 5), (7, 7)):
+            assert result[y, x] == fb_display._rgb_tuple_to_fb(*map(int, rgb[y, x]))
+
     def test_16bpp_rgb565_white(self):
         """White in RGB565 should be 0xFFFF."""
         fb_display.fb_bpp = 16
@@ -341,6 +549,33 @@ class TestRgbTupleToFb:
         assert result == 0xFFFF
 
 
+class TestFbPixelValues:
+    """Test vectorized bar color conversion against the scalar path."""
+
+    COLORS = [(255, 128, 64), (0, 200, 17), (3, 4, 250)]
+
+    def test_16bpp_matches_scalar(self):
+        fb_display.fb_bpp = 16
+        values = fb_display._fb_pixel_values(self.COLORS)
+        assert values.dtype == np.uint16
+        assert [int(v) for v in values] == [
+            fb_display._rgb_tuple_to_fb(*c) for c in self.COLORS
+        ]
+
+    def test_32bpp_fill_writes_native_bytes(self):
+        for big_endian in (False, True):
+            fb_display.fb_bpp = 32
+            fb_display.fb_big_endian = big_endian
+            values = fb_display._fb_pixel_values(self.COLORS)
+            assert values.dtype == np.uint32
+            buf = np.zeros((2, 3, 4), dtype=np.uint8)
+            buf.view(np.uint32)[:, :, 0][:, 1] = values[0]
+            expected = fb_display._rgb_tuple_to_fb(*self.COLORS[0])
+            assert tuple(buf[0, 1]) == expected
+            assert tuple(buf[1, 1]) == expected
+            assert tuple(buf[0, 0]) == (0, 0, 0, 0)
+
+
 class TestScaleToFb:
     """Test render-to-FB resolution scaling."""
 
@@ -381,6 +616,77 @@ class TestScaleToFb:
         assert result.dtype == np.uint8
         assert result.shape[2] == 4
 
+    def test_integer_ratio_matches_repeat(self):
+        fb_display.WIDTH = 100
+        fb_display.FB_WIDTH = 200
+        fb_display.HEIGHT = 100
+        fb_display.FB_HEIGHT = 300
+        pixels = np.arange(3 * 5 * 4, dtype=np.uint8).reshape(3, 5, 4)
+        result = fb_display._scale_to_fb(pixels)
+        assert np.array_equal(result, pixels.repeat(3, axis=0).repeat(2, axis=1))
+
+    def test_non_integer_ratio(self):
+        fb_display.WIDTH = 100
+        fb_display.FB_WIDTH = 150
+        fb_display.HEIGHT = 100
+        fb_display.FB_HEIGHT = 150
+        pixels = np.arange(4 * 4, dtype=np.uint16).reshape(4, 4)
+        result = fb_display._scale_to_fb(pixels)
+        assert result.shape == (6, 6)
+        assert np.array_equal(result[0], [0, 0, 1, 2, 2, 3])
+
+    def test_index_cache_bounded(self):
+        fb_display.WIDTH = 100
+        fb_display.FB_WIDTH = 150  # non-integer ratio uses the index cache
+        fb_display.HEIGHT = 100
+        fb_display.FB_HEIGHT = 150
+        fb_display._scale_idx_cache.clear()
+        for n in range(1, fb_display._SCALE_IDX_CACHE_MAX + 10):
+            fb_display._scale_to_fb(np.ones((n, 4), dtype=np.uint16))
+        assert len(fb_display._scale_idx_cache) == fb_display._SCALE_IDX_CACHE_MAX
+
+
+class TestWriteRegionToFb:
+    """Test framebuffer region writes through the mmap byte view."""
+
+    def _setup(self, monkeypatch, bpp: int, stride_pad: int = 0):
+        monkeypatch.setattr(fb_display, "WIDTH", 8)
+        monkeypatch.setattr(fb_display, "HEIGHT", 4)
+        monkeypatch.setattr(fb_display, "FB_WIDTH", 8)
+        monkeypatch.setattr(fb_display, "FB_HEIGHT", 4)
+        monkeypatch.setattr(fb_display, "fb_bpp", bpp)
+        stride = 8 * bpp // 8 + stride_pad
+        monkeypatch.setattr(fb_display, "fb_stride", stride)
+        fb = bytearray(stride * 4)
+        monkeypatch.setattr(fb_display, "fb_mmap", fb)
+        return fb, stride
+
+    def test_16bpp_region(self, monkeypatch):
+        fb, stride = self._setup(monkeypatch, 16)
+        pixels = np.array([[0x1111, 0x2222, 0x3333], [0x4444, 0x5555, 0x6666]], np.uint16)
+        fb_display.write_region_to_fb_fast(pixels, 2, 1)
+        for row in range(2):
+            start = (1 + row) * stride + 2 * 2
+            assert bytes(fb[start : start + 6]) == pixels[row].tobytes()
+        assert fb[:stride] == bytearray(stride)  # row 0 untouched
+        assert fb[stride : stride + 4] == bytearray(4)  # left of region untouched
+
+    def test_32bpp_region_with_padded_stride(self, monkeypatch):
+        fb, stride = self._setup(monkeypatch, 32, stride_pad=16)
+        pixels = np.arange(2 * 2 * 4, dtype=np.uint8).reshape(2, 2, 4)
+        fb_display.write_region_to_fb_fast(pixels, 6, 2)
+        for row in range(2):
+            start = (2 + row) * stride + 6 * 4
+            assert bytes(fb[start : start + 8]) == pixels[row].tobytes()
+            assert fb[start + 8 : (3 + row) * stride] == bytearray(16)  # padding
+
+    def test_full_frame(self, monkeypatch):
+        fb, stride = self._setup(monkeypatch, 16, stride_pad=4)
+        fb_display.write_full_frame(Image.new("RGB", (8, 4), (255, 255, 255)))
+        for row in range(4):
+            assert fb[row * stride : row * stride + 16] == b"\xff" * 16
+            assert fb[row * stride + 16 : (row + 1) * stride] == bytearray(4)
+
 
 class TestResizeBands:
     """Test band array resizing."""
@@ -394,6 +700,7 @@ class TestResizeBands:
             assert len(fb_display.display_bands) == 31
             assert len(fb_display.peak_bands) == 31
             assert len(fb_display.peak_time) == 31
+            assert len(fb_display.generate_idle_wave()) == 31
         finally:
             fb_display.resize_bands(old)
 
@@ -535,6 +842,13 @@ class TestDiscoverSnapservers:
         servers = asyncio.run(fb_display.discover_snapservers(timeout=0.1))
         assert "192.168.63.104" in servers
 
+        # First reply ends discovery after the settle delay, not the timeout
+        monkeypatch.setattr(fb_display, "DISCOVERY_SETTLE", 0.05)
+        start = time.monotonic()
+        servers = asyncio.run(fb_display.discover_snapservers(timeout=5.0))
+        assert servers == ["192.168.63.104"]
+        assert time.monotonic() - start < 1.0
+
     def test_empty_discovery(self, monkeypatch):
         """No servers found returns empty list."""
         import types
@@ -569,6 +883,9 @@ class TestHandleMetadataMessage:
         fb_display.server_info = {}
         fb_display.current_metadata = None
         fb_display.metadata_version = 0
+        fb_display._current_fingerprint = ()
+        fb_display._current_volume = ()
+        fb_display._volume_redraw_at = 0.0
 
     def test_server_info_updates_global(self):
         """server_info message populates the server_info global."""
@@ -612,6 +929,89 @@ class TestHandleMetadataMessage:
         assert fb_display.server_info == {}
 
 
+class TestMetadataFingerprint:
+    """Test base-frame change detection."""
+
+    def setup_method(self):
+        fb_display.current_metadata = None
+        fb_display.metadata_version = 0
+        fb_display._current_fingerprint = ()
+        fb_display._current_volume = ()
+        fb_display._volume_redraw_at = 0.0
+
+    def test_identical_same_fingerprint(self):
+        meta = {"title": "Song", "artist": "Band", "playing": True}
+        assert fb_display._metadata_fingerprint(meta) == fb_display._metadata_fingerprint(
+            dict(meta)
+        )
+
+    def test_title_change_detected(self):
+        old = {"title": "Song A", "artist": "Band"}
+        new = {"title": "Song B", "artist": "Band"}
+        assert fb_display._metadata_fingerprint(old) != fb_display._metadata_fingerprint(new)
+
+    def test_volume_change_detected(self):
+        assert fb_display._volume_fingerprint(
+            {"volume": 50}
+        ) != fb_display._volume_fingerprint({"volume": 60})
+
+    def test_volume_not_in_stable_fingerprint(self):
+        old = {"title": "Song", "volume": 50, "muted": False}
+        new = {"title": "Song", "volume": 60, "muted": True}
+        assert fb_display._metadata_fingerprint(old) == fb_display._metadata_fingerprint(new)
+
+    def test_volatile_fields_ignored(self):
+        old = {"title": "Song", "bitrate": 320, "elapsed": 10, "duration": 200}
+        new = {"title": "Song", "bitrate": 256, "elapsed": 12, "duration": 201}
+        assert fb_display._metadata_fingerprint(old) == fb_display._metadata_fingerprint(new)
+
+    def test_missing_vs_added_field(self):
+        assert fb_display._metadata_fingerprint({}) != fb_display._metadata_fingerprint(
+            {"genre": "Jazz"}
+        )
+
+    def test_first_message_bumps_version(self):
+        asyncio.run(fb_display._handle_metadata_message('{"title": "Song"}'))
+        assert fb_display.metadata_version == 1
+
+    def test_volatile_only_message_keeps_version(self):
+        asyncio.run(fb_display._handle_metadata_message('{"title": "Song", "bitrate": 320}'))
+        version = fb_display.metadata_version
+        asyncio.run(fb_display._handle_metadata_message('{"title": "Song", "bitrate": 256}'))
+        assert fb_display.metadata_version == version
+        assert fb_display.current_metadata["bitrate"] == 256
+
+    def test_stable_change_bumps_version(self):
+        asyncio.run(fb_display._handle_metadata_message('{"title": "Song A"}'))
+        version = fb_display.metadata_version
+        asyncio.run(fb_display._handle_metadata_message('{"title": "Song B"}'))
+        assert fb_display.metadata_version == version + 1
+
+    def test_volume_changes_coalesced(self, monkeypatch):
+        asyncio.run(fb_display._handle_metadata_message('{"title": "Song", "volume": 50}'))
+        version = fb_display.metadata_version
+        for vol in (55, 60, 65):
+            asyncio.run(
+                fb_display._handle_metadata_message(f'{{"title": "Song", "volume": {vol}}}')
+            )
+        assert fb_display.metadata_version == version
+        fb_display._flush_volume_redraw()
+        assert fb_display.metadata_version == version  # not yet due
+        monkeypatch.setattr(fb_display, "_volume_redraw_at", time.monotonic() - 0.01)
+        fb_display._flush_volume_redraw()
+        assert fb_display.metadata_version == version + 1
+        assert fb_display.current_metadata["volume"] == 65
+        fb_display._flush_volume_redraw()
+        assert fb_display.metadata_version == version + 1
+
+    def test_stable_change_cancels_pending_volume_redraw(self):
+        asyncio.run(fb_display._handle_metadata_message('{"title": "A", "volume": 50}'))
+        asyncio.run(fb_display._handle_metadata_message('{"title": "A", "volume": 60}'))
+        assert fb_display._volume_redraw_at
+        asyncio.run(fb_display._handle_metadata_message('{"title": "B", "volume": 60}'))
+        assert fb_display._volume_redraw_at == 0.0
+
+
 class TestVersionSuffix:
     """Test ver_suffix formatting logic from render_base_frame (4 combinations)."""
 
@@ -667,3 +1067,8 @@ class TestIsSpectrumActive:
         fb_display.bands[:] = fb_display.NOISE_FLOOR
         fb_display.bands[0] = fb_display.NOISE_FLOOR + 4
         assert fb_display.is_spectrum_active()
+
+    def test_at_threshold_not_active(self):
+        fb_display.bands[:] = fb_display.NOISE_FLOOR
+        fb_display.bands[0] = fb_display.SPECTRUM_ACTIVE_THRESHOLD
+        assert not fb_display.is_spectrum_active()
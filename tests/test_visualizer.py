@@ -63,6 +63,12 @@ class TestBandBins:
         nyquist_bin = visualizer.FFT_SIZE // 2
         assert bins[-1][1] >= nyquist_bin * 0.8
 
+    def test_index_arrays_within_spectrum(self):
+        spec_len = visualizer.FFT_SIZE // 2 + 1
+        assert len(visualizer._BAND_EDGES) == visualizer.NUM_BANDS
+        assert visualizer._BAND_HI.max() <= spec_len
+        assert (visualizer._BAND_HI >= visualizer._BAND_EDGES).all()
+
 
 class TestAnalyzePcm:
     """Test PCM analysis pipeline."""
@@ -70,7 +76,9 @@ class TestAnalyzePcm:
     def setup_method(self):
         """Reset global state before each test."""
         visualizer.prev_db = np.full(visualizer.NUM_BANDS, visualizer.NOISE_FLOOR, dtype=np.float32)
-        visualizer.audio_ring = np.zeros(visualizer.FFT_SIZE, dtype=np.float32)
+        visualizer.audio_ring = np.zeros(2 * visualizer.FFT_SIZE, dtype=np.float32)
+        visualizer._ring_pos = 0
+        visualizer._dc_estimate = 0.0
 
     def test_silence_returns_noise_floor(self):
         """Pure silence should return noise floor for all bands."""
@@ -80,6 +88,24 @@ class TestAnalyzePcm:
         assert len(values) == visualizer.NUM_BANDS
         assert all(v == visualizer.NOISE_FLOOR for v in values)
 
+    def test_silence_skips_fft(self, monkeypatch):
+        """Silent hops should return the cached frame without running the FFT."""
+        def fail(*args, **kwargs):
+            raise AssertionError("rfft called on silence")
+
+        monkeypatch.setattr(visualizer.np.fft, "rfft", fail)
+        silence = np.zeros(visualizer.HOP_SIZE, dtype=np.float32)
+        assert visualizer.analyze_pcm(silence) == visualizer._SILENCE_OUT
+
+    def test_silence_resets_ring_state(self):
+        t = np.arange(visualizer.HOP_SIZE, dtype=np.float32)
+        visualizer.analyze_pcm(30000.0 * np.sin(2 * np.pi * 1000 * t / visualizer.SAMPLE_RATE))
+        assert visualizer._ring_pos != 0
+        visualizer.analyze_pcm(np.zeros(visualizer.HOP_SIZE, dtype=np.float32))
+        assert visualizer._ring_pos == 0
+        assert not visualizer.audio_ring.any()
+        assert (visualizer.prev_db == visualizer.NOISE_FLOOR).all()
+
     def test_output_format(self):
         """Output should be semicolon-separated float values."""
         # Generate a 1kHz sine wave at full scale
@@ -170,6 +196,33 @@ class TestAnalyzePcm:
             f"DC leaking into lowest band: {values[0]} dBFS"
         )
 
+    def test_ring_window_is_chronological_across_wrap(self):
+        """The FFT window view should hold the last FFT_SIZE samples in order."""
+        hop = visualizer.HOP_SIZE
+        total = visualizer.FFT_SIZE + 3 * hop  # forces at least one wrap
+        stream = np.arange(1000.0, 1000.0 + total, dtype=np.float32)
+        for i in range(0, total, hop):
+            visualizer.analyze_pcm(stream[i:i + hop])
+        pos = visualizer._ring_pos
+        window = visualizer.audio_ring[pos:pos + visualizer.FFT_SIZE]
+        np.testing.assert_array_equal(window, stream[-visualizer.FFT_SIZE:])
+
+
+class TestFormatDb:
+    """Test the per-frame output string."""
+
+    def test_one_decimal_per_band(self):
+        vals = np.linspace(-72.0, 0.0, visualizer.NUM_BANDS, dtype=np.float32)
+        parts = visualizer._format_db(vals).split(";")
+        assert len(parts) == visualizer.NUM_BANDS
+        assert parts[0] == "-72.0"
+        assert parts[-1] == "0.0"
+        assert all(len(p.split(".")[1]) == 1 for p in parts)
+
+    def test_rounds_to_nearest_tenth(self):
+        vals = np.full(visualizer.NUM_BANDS, -12.34, dtype=np.float32)
+        assert visualizer._format_db(vals).split(";")[0] == "-12.3"
+
 
 class TestSmoothingCoefficients:
     """Test that smoothing coefficients are in valid range."""
@@ -219,6 +272,16 @@ class TestBroadcast:
         asyncio.run(visualizer.broadcast("data2"))
         assert client.send.await_count == 2
 
+    def test_dead_client_removed(self):
+        """A client whose send fails is dropped; others still receive data."""
+        good = AsyncMock()
+        bad = AsyncMock()
+        bad.send.side_effect = OSError("broken pipe")
+        visualizer.clients.update({good, bad})
+        asyncio.run(visualizer.broadcast("data1"))
+        good.send.assert_awaited_once_with("data1")
+        assert visualizer.clients == {good}
+
     def test_no_clients_resets_cache(self):
         """Empty client set should reset _last_broadcast."""
         visualizer._last_broadcast = "stale"